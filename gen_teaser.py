@@ -1,17 +1,28 @@
-"""Generate a horizontal rolling terminal teaser video."""
+"""Generate a horizontal rolling terminal teaser video.
+
+Frame composition is plain Pillow, so on the render host the AVX2 build of
+Pillow-SIMD is a drop-in speedup for the fills, pastes and text blits:
+
+    pip uninstall -y pillow
+    CC="cc -mavx2" pip install -U --force-reinstall pillow-simd
+"""
 
 from PIL import Image, ImageDraw, ImageFont
 import os
 import subprocess
-import tempfile
-import shutil
 import math
+import queue
+import sys
+import threading
 
 # ── Config ──
-W, H = 3840, 2160  # 4K 16:9
-PAD_X = 112
-PAD_Y = 80
-TITLE_BAR_H = 96
+# Frames are drawn at 1080p and upscaled to the 4K master by ffmpeg — a
+# quarter of the pixels through every fill, paste, tobytes and pipe write.
+W, H = 1920, 1080  # render size, 16:9
+OUT_W, OUT_H = 3840, 2160  # 4K output
+PAD_X = 56
+PAD_Y = 40
+TITLE_BAR_H = 48
 BG = (13, 13, 15)
 TITLE_BG = (30, 30, 34)
 FG = (230, 230, 230)
@@ -30,8 +41,8 @@ SPINNER_COLOR = PRIMARY
 BAR_BG = (40, 40, 48)
 BAR_FG = PRIMARY
 
-LINE_H = 92
-FONT_SIZE = 64
+LINE_H = 46
+FONT_SIZE = 32
 FPS = 24
 BLINK_INTERVAL = 12
 SCROLL_SPEED = 0.15  # lerp factor for smooth scroll
@@ -62,7 +73,7 @@ CHAR_W = bbox[2] - bbox[0]
 small_font = None
 for fp in FONT_PATHS:
     try:
-        small_font = ImageFont.truetype(fp, FONT_SIZE - 16)
+        small_font = ImageFont.truetype(fp, FONT_SIZE - 8)
         break
     except (OSError, IOError):
         continue
@@ -100,97 +111,358 @@ def draw_title_bar(draw):
     """Draw macOS-style terminal title bar."""
     draw.rectangle([0, 0, W, TITLE_BAR_H], fill=TITLE_BG)
     dot_y = TITLE_BAR_H // 2
-    dot_r = 14
-    dot_x_start = 48
-    dot_gap = 48
+    dot_r = 7
+    dot_x_start = 24
+    dot_gap = 24
     for i, c in enumerate([(255, 95, 86), (255, 189, 46), (39, 201, 63)]):
         cx = dot_x_start + i * dot_gap
         draw.ellipse([cx - dot_r, dot_y - dot_r, cx + dot_r, dot_y + dot_r], fill=c)
 
 
+# Text atlas — every (run of text, font) pair is rasterized once into an
+# alpha mask, so drawing a span is a single paste instead of a draw.text.
+TEXT_MASKS = {}
+
+
+def text_mask(text, fnt):
+    """(mask, left, top) for one run of text."""
+    m = TEXT_MASKS.get((text, fnt))
+    if m is None:
+        left, top, right, bottom = fnt.getbbox(text)
+        mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=fnt)
+        m = TEXT_MASKS[(text, fnt)] = (mask, left, top)
+    return m
+
+
+def blit_text(img, xy, text, color, fnt=font):
+    """Same pixels as draw.text at integer coordinates, from the atlas."""
+    if text:
+        mask, left, top = text_mask(text, fnt)
+        img.paste(color, (int(xy[0]) + left, xy[1] + top), mask)
+
+
+# Static backdrop — background + title bar rasterized once, copied per frame
+_BG = Image.new("RGB", (W, H), BG)
+draw_title_bar(ImageDraw.Draw(_BG))
+_TITLE_STRIP = _BG.crop((0, 0, W, TITLE_BAR_H + 1))
+_ROW_BG = Image.new("RGB", (W, LINE_H), BG)
+
+# Persistent canvas — between frames at the same scroll position only the
+# rows whose content changed are cleared and redrawn.
+EXTRA_ROWS = 2  # rows below the content owned by extra_draw (spinner + bar)
+_canvas = _BG.copy()  # allocated once, reset in place — never Image.new per frame
+_canvas_base_y = None
+_canvas_rows = {}  # row index -> content key of what is drawn there
+
+# Rasterized lines — a line never changes once appended, so its text is
+# drawn once into a tile and pasted on every later repaint.
+LINE_CACHE = {}
+
+
+def ink_spill(x, text, color):
+    """Parts of a run's ink outside the 0..LINE_H band, as (x, y, color, mask).
+
+    Box-drawing glyphs in the Menlo/DejaVu family reach a pixel above the
+    line origin; that row belongs to the band above.
+    """
+    mask, left, top = text_mask(text, font)
+    spill = []
+    if top < 0:
+        spill.append((x + left, top, color, mask.crop((0, 0, mask.width, -top))))
+    if top + mask.height > LINE_H:
+        spill.append((x + left, LINE_H, color,
+                      mask.crop((0, LINE_H - top, mask.width, mask.height))))
+    return spill
+
+
+def line_tile(key):
+    """(tile, spill) for a line's spans.
+
+    tile is the opaque LINE_H band cropped to the ink width; spill holds
+    the ink that lands in the neighbouring bands, pasted through its mask
+    so those rows keep their own pixels.
+    """
+    entry = LINE_CACHE.get(key)
+    if entry is None:
+        x = 0
+        tile_w = 1
+        for text, color, w in key:
+            if text:
+                tile_w = max(tile_w, x + font.getbbox(text)[2])
+            x += w
+        tile = Image.new("RGB", (min(tile_w, W - PAD_X), LINE_H), BG)
+        spill = []
+        x = 0
+        for text, color, w in key:
+            if text:
+                blit_text(tile, (x, 0), text, color)
+                spill += ink_spill(x, text, color)
+            x += w
+        entry = LINE_CACHE[key] = (tile, spill)
+    return entry
+
+
+def row_spill(key):
+    """Spill of the content drawn on a row — only committed lines have any."""
+    if key and isinstance(key, tuple) and isinstance(key[0], tuple):
+        return line_tile(key)[1]
+    return ()
+
+
+# The line being typed grows one character per frame: keep it on a reusable
+# tile and draw only the characters added since the previous frame.
+_typing_tile = Image.new("RGB", (W - PAD_X, LINE_H), BG)
+_typing_key = ()  # spans currently drawn on _typing_tile
+
+
+def typing_tile(parts):
+    """Tile for the cursor line, extended in place while it only grows."""
+    global _typing_key
+    prev = _typing_key
+    n = len(prev)
+    if (n and len(parts) >= n and parts[:n - 1] == prev[:-1]
+            and parts[n - 1][1] == prev[-1][1]
+            and parts[n - 1][0].startswith(prev[-1][0])
+            and float(font.getlength(prev[-1][0])).is_integer()):
+        start, done = n - 1, len(prev[-1][0])
+    else:
+        _typing_tile.paste(BG, (0, 0) + _typing_tile.size)
+        start, done = 0, 0
+    x = sum(w for _, _, w in parts[:start])
+    for text, color, w in parts[start:]:
+        if len(text) > done:
+            # With whole-pixel advances the tail lands where the full span
+            # would have put it; only anti-aliasing where neighbouring glyphs
+            # overlap can differ by a pixel. Fractional advances (raqm or
+            # unhinted layout) redraw the tile from scratch instead.
+            blit_text(_typing_tile, (x + font.getlength(text[:done]), 0),
+                      text[done:], color)
+        x += w
+        done = 0
+    _typing_key = parts
+    return _typing_tile
+
+
+def scroll_canvas(dy, base_y):
+    """Shift the canvas contents by dy pixels, like a terminal scroll.
+
+    Rows keep their pixels; only the bands the shift leaves invalid are
+    cleared, and their rows dropped from _canvas_rows so they get redrawn.
+    """
+    if dy < 0:
+        _canvas.paste(_canvas.crop((0, -dy, W, H)), (0, 0))
+        bands = [(H + dy, H)]  # exposed at the bottom
+    else:
+        _canvas.paste(_canvas.crop((0, 0, W, H - dy)), (0, dy))
+        # exposed at the top, plus the title strip that moved down with it
+        bands = [(0, min(H, dy + TITLE_BAR_H + 1))]
+    for top, bottom in bands:
+        _canvas.paste(BG, (0, top, W, bottom))
+        for idx in range((top - base_y) // LINE_H,
+                         (bottom - 1 - base_y) // LINE_H + 1):
+            _canvas_rows.pop(idx, None)
+
+
 def render_frame(lines, scroll_offset, cursor_parts=None, cursor_visible=True,
-                 extra_draw=None):
-    """Render a frame with scrolling viewport."""
-    img = Image.new("RGB", (W, H), BG)
+                 extra_draw=None, extra_args=()):
+    """Render a frame with scrolling viewport.
+
+    extra_draw(img, draw, base_y, n_lines, *extra_args) paints the
+    EXTRA_ROWS rows below the content (spinner + progress bar).
+
+    Returns the shared canvas, which is patched in place by the next call —
+    emit it before rendering again.
+    """
+    global _canvas_base_y, _canvas_rows
+    base_y = TITLE_BAR_H + PAD_Y - int(scroll_offset)
+    n_lines = len(lines)
+
+    # Content key per visible row; the dynamic tail (cursor / extra_draw)
+    # sits on the rows just below the content.
+    # Only lines inside the viewport: TITLE_BAR_H - LINE_H <= y <= H
+    first_idx = max(0, -((base_y - TITLE_BAR_H + LINE_H) // LINE_H))
+    last_idx = min(n_lines, (H - base_y) // LINE_H + 1)
+    rows = {idx: tuple(lines[idx]) for idx in range(first_idx, last_idx)}
+    show_cursor = cursor_visible and cursor_parts is not None
+    if extra_draw:
+        tail = object()  # opaque callback — always repaint
+        for idx in range(n_lines, n_lines + EXTRA_ROWS):
+            rows[idx] = tail
+    elif show_cursor:
+        rows[n_lines] = ("cursor", tuple(cursor_parts))
+
+    if _canvas_base_y is None or abs(base_y - _canvas_base_y) >= H:
+        # Nothing reusable — start over from the backdrop, same buffer
+        _canvas.paste(_BG, (0, 0))
+        _canvas_rows = {}
+    elif base_y != _canvas_base_y:
+        scroll_canvas(base_y - _canvas_base_y, base_y)
+    _canvas_base_y = base_y
+    changed = {idx for idx in rows.keys() | _canvas_rows.keys()
+               if rows.get(idx) != _canvas_rows.get(idx)}
+    # A row whose old or new line spills into a neighbour takes that
+    # neighbour's band with it, so stale spill is cleared along with the row
+    stale = set(changed)
+    for idx in changed:
+        for key in (rows.get(idx), _canvas_rows.get(idx)):
+            for _, dy, _, _ in row_spill(key):
+                stale.add(idx - 1 if dy < 0 else idx + 1)
+    for idx in stale:
+        _canvas.paste(_ROW_BG, (0, base_y + idx * LINE_H))
+    _canvas_rows = rows
+    img = _canvas
     draw = ImageDraw.Draw(img)
 
     # Draw content with scroll offset
-    base_y = TITLE_BAR_H + PAD_Y - int(scroll_offset)
-    for idx, parts in enumerate(lines):
-        y = base_y + idx * LINE_H
-        # Skip lines outside viewport
-        if y < TITLE_BAR_H - LINE_H or y > H:
-            continue
-        x = PAD_X
-        for text, color in parts:
-            draw.text((x, y), text, fill=color, font=font)
-            x += len(text) * CHAR_W
+    for idx in stale:
+        if idx < n_lines and idx in rows:
+            img.paste(line_tile(rows[idx])[0], (PAD_X, base_y + idx * LINE_H))
+    # Then the neighbours' spill into each cleared band, through its mask
+    for idx in stale:
+        for src, up in ((idx + 1, True), (idx - 1, False)):
+            if src < n_lines and src in rows:
+                y = base_y + src * LINE_H
+                for x, dy, color, mask in row_spill(rows[src]):
+                    if (dy < 0) == up:
+                        img.paste(color, (PAD_X + x, y + dy), mask)
 
     # Draw cursor
-    if cursor_visible and cursor_parts is not None:
-        cursor_line_idx = len(lines)
-        if cursor_parts:
-            # Draw the cursor line content
-            y = base_y + cursor_line_idx * LINE_H
-            if TITLE_BAR_H <= y <= H:
-                x = PAD_X
-                for text, color in cursor_parts:
-                    draw.text((x, y), text, fill=color, font=font)
-                    x += len(text) * CHAR_W
-                draw.rectangle([x, y + 8, x + CHAR_W - 8, y + LINE_H - 16],
-                               fill=CURSOR_COLOR)
-        else:
-            y = base_y + len(lines) * LINE_H
-            if TITLE_BAR_H <= y <= H:
-                x = PAD_X
-                draw.rectangle([x, y + 8, x + CHAR_W - 8, y + LINE_H - 16],
-                               fill=CURSOR_COLOR)
+    if show_cursor and n_lines in stale:
+        y = base_y + n_lines * LINE_H
+        if TITLE_BAR_H <= y <= H:
+            x = PAD_X
+            if cursor_parts:
+                # Draw the cursor line content
+                img.paste(typing_tile(rows[n_lines][1]), (PAD_X, y))
+                x += sum(w for _, _, w in cursor_parts)
+            draw.rectangle([x, y + 4, x + CHAR_W - 4, y + LINE_H - 8],
+                           fill=CURSOR_COLOR)
 
     # Extra drawing callback (for progress bars)
     if extra_draw:
-        extra_draw(draw, base_y, len(lines))
+        extra_draw(img, draw, base_y, n_lines, *extra_args)
 
     # Title bar on top (overdraw to cover scrolled content)
-    draw.rectangle([0, 0, W, TITLE_BAR_H], fill=TITLE_BG)
-    draw_title_bar(draw)
+    img.paste(_TITLE_STRIP, (0, 0))
 
     return img
 
 
+# ── Encoder ──
+def video_codec_args():
+    """Prefer the VideoToolbox hardware H.264 encoder when ffmpeg has it."""
+    encoders = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                              capture_output=True, text=True).stdout
+    if "h264_videotoolbox" in encoders:
+        return ["-c:v", "h264_videotoolbox", "-b:v", "40M", "-profile:v", "high"]
+    return ["-c:v", "libx264", "-crf", "12", "-preset", "slow"]
+
+
+mp4_path = "/Users/ankitpansari/Desktop/kinobi-landing/teaser.mp4"
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo",
+    "-pix_fmt", "rgb24",
+    "-s", f"{W}x{H}",
+    "-framerate", str(FPS),
+    "-i", "-",
+    "-vf", f"scale={OUT_W}:{OUT_H}:flags=lanczos",
+    *video_codec_args(),
+    "-pix_fmt", "yuv420p",
+    "-movflags", "+faststart",
+    mp4_path,
+], stdin=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1024 * 1024)
+frame_count = 0
+
+# Drain ffmpeg's log as it is written — a full stderr pipe would otherwise
+# block the encoder, and with it our stdin writes. Shown only on failure.
+ffmpeg_log = []
+log_drain = threading.Thread(target=lambda: ffmpeg_log.append(proc.stderr.read()),
+                             daemon=True)
+log_drain.start()
+
+# Pipe writes run on a background thread (the GIL is released while ffmpeg
+# drains the pipe), so rendering the next frame overlaps sending this one.
+# Bounded so only a few raw frames are ever in flight.
+frame_queue = queue.Queue(maxsize=4)
+
+
+def pipe_writer():
+    while True:
+        buf = frame_queue.get()
+        if buf is None:
+            break
+        try:
+            proc.stdin.write(buf)
+        except BrokenPipeError:
+            pass  # ffmpeg died; keep draining so emit() never blocks
+
+
+writer = threading.Thread(target=pipe_writer, daemon=True)
+writer.start()
+
+
+def emit(img, repeat=1):
+    """Stream a frame straight into the encoder — raw RGB, no PNG round trip.
+
+    repeat writes the same frame several times from a single snapshot, for
+    stretches where nothing on screen changes.
+    """
+    global frame_count
+    # Snapshot now: the canvas is patched in place by the next render_frame
+    buf = img.tobytes()
+    for _ in range(repeat):
+        frame_queue.put(buf)
+    frame_count += repeat
+
+
 # ── Frame helpers ──
-PROMPT = [("→ ", PROMPT_COLOR)]
+def span(text, color):
+    """A styled run of text, with its advance width computed once."""
+    return (text, color, len(text) * CHAR_W)
+
+
+PROMPT = [span("→ ", PROMPT_COLOR)]
 
-frames = []
 current_lines = []
 
 
-def add_typing(text, color, prompt=True, speed=1, frames_list=None):
+def add_typing(text, color, prompt=True, speed=1):
     """Type text character by character with smooth scroll."""
     global scroll_y
-    if frames_list is None:
-        frames_list = frames
     prefix = list(PROMPT) if prompt else []
     for i in range(len(text)):
         partial = text[:i+1]
-        cursor_parts = prefix + [(partial, color)]
+        cursor_parts = prefix + [span(partial, color)]
         tgt = target_scroll(current_lines + [cursor_parts])
         scroll_y = smooth_scroll(scroll_y, tgt)
-        f = render_frame(current_lines, scroll_y, cursor_parts=cursor_parts)
+        # Skipped characters still advance the scroll, but are never shown —
+        # only render the ones that get emitted (the canvas keeps the
+        # backdrop, so each of those just repaints the cursor row)
         if i % speed == 0:
-            frames_list.append(f)
+            emit(render_frame(current_lines, scroll_y, cursor_parts=cursor_parts))
 
 
 def add_pause(n_frames, blink=True):
     """Add pause with optional blinking cursor and smooth scroll."""
     global scroll_y
-    for i in range(n_frames):
+    i = 0
+    while i < n_frames:
         tgt = target_scroll(current_lines)
         scroll_y = smooth_scroll(scroll_y, tgt)
         vis = (i // BLINK_INTERVAL) % 2 == 0 if blink else True
         cursor = list(PROMPT)
         f = render_frame(current_lines, scroll_y,
                          cursor_parts=cursor, cursor_visible=vis)
-        frames.append(f)
+        # Once scrolled into place, nothing changes until the next blink
+        # toggle (or the end of the pause) — emit that whole run at once
+        run = 1
+        if scroll_y == tgt:
+            run = BLINK_INTERVAL - i % BLINK_INTERVAL if blink else n_frames - i
+            run = min(run, n_frames - i)
+        emit(f, run)
+        i += run
 
 
 def add_output_lines(output, delay=3):
@@ -198,11 +470,57 @@ def add_output_lines(output, delay=3):
     global scroll_y
     for line in output:
         current_lines.append(line)
-        for _ in range(delay):
+        remaining = delay
+        while remaining:
             tgt = target_scroll(current_lines)
             scroll_y = smooth_scroll(scroll_y, tgt)
             f = render_frame(current_lines, scroll_y)
-            frames.append(f)
+            # Scrolled into place — the rest of the delay is this same frame
+            run = remaining if scroll_y == tgt else 1
+            emit(f, run)
+            remaining -= run
+
+
+# Spinner + progress bar geometry (fixed per run)
+SPIN_X = PAD_X + 2 * CHAR_W
+STATUS_X = SPIN_X + 2 * CHAR_W
+BAR_X = SPIN_X
+BAR_W = 440
+BAR_H = 18
+BAR_RADIUS = 5
+BAR_Y_OFF = (LINE_H - BAR_H) // 2
+PCT_X = BAR_X + BAR_W + 16
+
+# Progress bar sprite — the rounded bar rasterized once as a hard-edged mask.
+# A partial fill is the bar's left part plus its right cap moved in.
+BAR_MASK = Image.new("L", (BAR_W + 1, BAR_H + 1), 0)
+ImageDraw.Draw(BAR_MASK).rounded_rectangle([0, 0, BAR_W, BAR_H],
+                                           radius=BAR_RADIUS, fill=255)
+BAR_CAP = BAR_MASK.crop((BAR_W - 2 * BAR_RADIUS, 0, BAR_W + 1, BAR_H + 1))
+
+
+def draw_spinner_extra(img, draw, base_y, n_lines, progress, spin, status_text, pct):
+    """extra_draw for add_spinner_progress: spinner line + progress bar."""
+    # Spinner line
+    y1 = base_y + n_lines * LINE_H
+    if TITLE_BAR_H <= y1 <= H:
+        blit_text(img, (SPIN_X, y1), spin + " ", SPINNER_COLOR)
+        blit_text(img, (STATUS_X, y1), status_text, DIM)
+    # Progress bar
+    y2 = base_y + (n_lines + 1) * LINE_H
+    if TITLE_BAR_H <= y2 <= H:
+        bar_y = y2 + BAR_Y_OFF
+        img.paste(BAR_BG, (BAR_X, bar_y), BAR_MASK)
+        fill_w = int(BAR_W * progress)
+        if fill_w > 3 * BAR_RADIUS:
+            body = BAR_MASK.crop((0, 0, fill_w - 2 * BAR_RADIUS, BAR_H + 1))
+            img.paste(BAR_FG, (BAR_X, bar_y), body)
+            img.paste(BAR_FG, (BAR_X + fill_w - 2 * BAR_RADIUS, bar_y), BAR_CAP)
+        elif fill_w > BAR_RADIUS:
+            # Too short for the end caps not to overlap — draw it directly
+            draw.rounded_rectangle([BAR_X, bar_y, BAR_X + fill_w, bar_y + BAR_H],
+                                   radius=BAR_RADIUS, fill=BAR_FG)
+        blit_text(img, (PCT_X, y2), f"{pct}%", DIM, small_font)
 
 
 def add_spinner_progress(status_text, n_frames=36,
@@ -217,30 +535,9 @@ def add_spinner_progress(status_text, n_frames=36,
         tgt = target_scroll(current_lines)
         scroll_y = smooth_scroll(scroll_y, tgt + LINE_H * 3)
 
-        def draw_extra(draw, base_y, n_lines, p=progress, s=spin, st=status_text, pc=pct):
-            # Spinner line
-            y1 = base_y + n_lines * LINE_H
-            if TITLE_BAR_H <= y1 <= H:
-                x = PAD_X + 2 * CHAR_W
-                draw.text((x, y1), s + " ", fill=SPINNER_COLOR, font=font)
-                draw.text((x + 2 * CHAR_W, y1), st, fill=DIM, font=font)
-            # Progress bar
-            y2 = base_y + (n_lines + 1) * LINE_H
-            if TITLE_BAR_H <= y2 <= H:
-                bar_x = PAD_X + 2 * CHAR_W
-                bar_h = 36
-                bar_w = 880
-                bar_y = y2 + (LINE_H - bar_h) // 2
-                draw.rounded_rectangle([bar_x, bar_y, bar_x + bar_w, bar_y + bar_h],
-                                        radius=10, fill=BAR_BG)
-                fill_w = int(bar_w * p)
-                if fill_w > 10:
-                    draw.rounded_rectangle([bar_x, bar_y, bar_x + fill_w, bar_y + bar_h],
-                                            radius=10, fill=BAR_FG)
-                draw.text((bar_x + bar_w + 32, y2), f"{pc}%", fill=DIM, font=small_font)
-
-        f = render_frame(current_lines, scroll_y, extra_draw=draw_extra)
-        frames.append(f)
+        f = render_frame(current_lines, scroll_y, extra_draw=draw_spinner_extra,
+                         extra_args=(progress, spin, status_text, pct))
+        emit(f)
 
 
 # ═══════════════════════════════════════════
@@ -252,12 +549,12 @@ add_pause(FPS // 2)
 
 # ─── Comment 1 ───
 add_typing("# what if your AI agent could do sales research?", COMMENT_COLOR, speed=2)
-current_lines.append(PROMPT + [("# what if your AI agent could do sales research?", COMMENT_COLOR)])
+current_lines.append(PROMPT + [span("# what if your AI agent could do sales research?", COMMENT_COLOR)])
 add_pause(FPS)
 
 # ─── Comment 2 ───
 add_typing("# let's find warm paths into a target account.", COMMENT_COLOR, speed=2)
-current_lines.append(PROMPT + [("# let's find warm paths into a target account.", COMMENT_COLOR)])
+current_lines.append(PROMPT + [span("# let's find warm paths into a target account.", COMMENT_COLOR)])
 add_pause(FPS)
 
 # ─── Spacing ───
@@ -268,7 +565,7 @@ cmd = "_____ search "
 arg = '"B+ fintech, hiring CX, Zendesk"'
 full = cmd + arg
 add_typing(full, CMD_COLOR)  # simplified — full line in CMD_COLOR for typing
-current_lines.append(PROMPT + [(cmd, CMD_COLOR), (arg, ARG_COLOR)])
+current_lines.append(PROMPT + [span(cmd, CMD_COLOR), span(arg, ARG_COLOR)])
 add_pause(8, blink=False)
 
 # Spinner
@@ -280,14 +577,14 @@ add_spinner_progress("scoring warm paths...", n_frames=18,
 # Search output
 add_output_lines([
     [],
-    [("  ✓ ", GREEN), ("1,095 pipeline companies indexed · ", DIM), ("98.7% accuracy", PRIMARY)],
-    [("  ✓ ", GREEN), ("12 matched · 47 warm paths", DIM)],
+    [span("  ✓ ", GREEN), span("1,095 pipeline companies indexed · ", DIM), span("98.7% accuracy", PRIMARY)],
+    [span("  ✓ ", GREEN), span("12 matched · 47 warm paths", DIM)],
     [],
-    [("  [1] ", PRIMARY), ("Ramp    ", FG), ("D · Intercom · Q3  · ", DIM), ("4 paths", GREEN)],
-    [("  [2] ", PRIMARY), ("Brex    ", FG), ("D · Zendesk  · up  · ", DIM), ("3 paths", GREEN)],
-    [("  [3] ", PRIMARY), ("Chime   ", FG), ("IPO · ZD · migrate · ", DIM), ("7 paths", GREEN)],
-    [("  [4] ", PRIMARY), ("Mercury ", FG), ("C · Custom · VP    · ", DIM), ("2 paths", GREEN)],
-    [("  ... 8 more", DIM)],
+    [span("  [1] ", PRIMARY), span("Ramp    ", FG), span("D · Intercom · Q3  · ", DIM), span("4 paths", GREEN)],
+    [span("  [2] ", PRIMARY), span("Brex    ", FG), span("D · Zendesk  · up  · ", DIM), span("3 paths", GREEN)],
+    [span("  [3] ", PRIMARY), span("Chime   ", FG), span("IPO · ZD · migrate · ", DIM), span("7 paths", GREEN)],
+    [span("  [4] ", PRIMARY), span("Mercury ", FG), span("C · Custom · VP    · ", DIM), span("2 paths", GREEN)],
+    [span("  ... 8 more", DIM)],
 ], delay=4)
 
 add_pause(FPS * 2)
@@ -300,7 +597,7 @@ cmd = "_____ enrich "
 arg = "ramp.com --depth full"
 full = cmd + arg
 add_typing(full, CMD_COLOR)
-current_lines.append(PROMPT + [(cmd, CMD_COLOR), (arg, ARG_COLOR)])
+current_lines.append(PROMPT + [span(cmd, CMD_COLOR), span(arg, ARG_COLOR)])
 add_pause(8, blink=False)
 
 # Spinner
@@ -312,13 +609,13 @@ add_spinner_progress("resolving leadership...", n_frames=18,
 # Enrich output
 add_output_lines([
     [],
-    [("  company:   ", DIM), ("Ramp", FG)],
-    [("  valuation: ", DIM), ("$32B ", PRIMARY), ("(Nov 2025)", DIM)],
-    [("  raised:    ", DIM), ("$2.3B total", FG)],
-    [("  employees: ", DIM), ("3,700+ ", FG), ("(3x YoY)", GREEN)],
-    [("  revenue:   ", DIM), ("$1B+ ARR", YELLOW)],
-    [("  stack:     ", DIM), ("Cohere.io, Snowflake, dbt", CYAN)],
-    [("  signal:    ", DIM), ('"CX Ops" posted 5d ago', YELLOW)],
+    [span("  company:   ", DIM), span("Ramp", FG)],
+    [span("  valuation: ", DIM), span("$32B ", PRIMARY), span("(Nov 2025)", DIM)],
+    [span("  raised:    ", DIM), span("$2.3B total", FG)],
+    [span("  employees: ", DIM), span("3,700+ ", FG), span("(3x YoY)", GREEN)],
+    [span("  revenue:   ", DIM), span("$1B+ ARR", YELLOW)],
+    [span("  stack:     ", DIM), span("Cohere.io, Snowflake, dbt", CYAN)],
+    [span("  signal:    ", DIM), span('"CX Ops" posted 5d ago', YELLOW)],
 ], delay=4)
 
 add_pause(FPS * 2)
@@ -331,7 +628,7 @@ cmd = "_____ agent "
 arg = '"analyze ramp, draft approach"'
 full = cmd + arg
 add_typing(full, CMD_COLOR)
-current_lines.append(PROMPT + [(cmd, CMD_COLOR), (arg, ARG_COLOR)])
+current_lines.append(PROMPT + [span(cmd, CMD_COLOR), span(arg, ARG_COLOR)])
 add_pause(8, blink=False)
 
 # Spinner — longer
@@ -345,13 +642,13 @@ add_spinner_progress("drafting approach...", n_frames=18,
 # Agent reasoning box
 add_output_lines([
     [],
-    [("  ┌─ ", DIM), ("agent reasoning", PRIMARY), (" ────────────────────────────────┐", DIM)],
-    [("  │ → ", DIM), ("CX scaling (+18% YoY)                       ", FG), ("│", DIM)],
-    [("  │ → ", DIM), ("Intercom renewal Q3                         ", FG), ("│", DIM)],
-    [("  │ → ", DIM), ("Torres → CTO Atiyeh                         ", FG), ("│", DIM)],
-    [("  │                                                  │", DIM)],
-    [("  │ ", DIM), ("rec: ", PRIMARY), ("intro via Sarah Chen. Timing optimal.  ", FG), ("│", DIM)],
-    [("  └──────────────────────────────────────────────────┘", DIM)],
+    [span("  ┌─ ", DIM), span("agent reasoning", PRIMARY), span(" ────────────────────────────────┐", DIM)],
+    [span("  │ → ", DIM), span("CX scaling (+18% YoY)                       ", FG), span("│", DIM)],
+    [span("  │ → ", DIM), span("Intercom renewal Q3                         ", FG), span("│", DIM)],
+    [span("  │ → ", DIM), span("Torres → CTO Atiyeh                         ", FG), span("│", DIM)],
+    [span("  │                                                  │", DIM)],
+    [span("  │ ", DIM), span("rec: ", PRIMARY), span("intro via Sarah Chen. Timing optimal.  ", FG), span("│", DIM)],
+    [span("  └──────────────────────────────────────────────────┘", DIM)],
 ], delay=8)
 
 add_pause(FPS * 2)
@@ -359,14 +656,14 @@ add_pause(FPS * 2)
 # Graph path visualization
 add_output_lines([
     [],
-    [("  ┌─ ", DIM), ("warm path", GREEN), (" ───────────────────────────────────────┐", DIM)],
-    [("  │                                                          │", DIM)],
-    [("  │    ", DIM), ("You", PRIMARY), ("  ─────→  ", DIM), ("Sarah Chen", FG), ("  ─────→  ", DIM), ("Eric Atiyeh", FG), ("   │", DIM)],
-    [("  │    ", DIM), ("          ", FG), ("ex-Stripe  ", DIM), ("            ", FG), ("CTO, Ramp  ", DIM), ("   │", DIM)],
-    [("  │    ", DIM), ("          ", FG), ("2019-2021  ", DIM), ("            ", FG), ("decision   ", DIM), ("   │", DIM)],
-    [("  │                                                          │", DIM)],
-    [("  │    ", DIM), ("strength: ", DIM), ("████████░░", PRIMARY), ("  82%", FG), ("   hops: ", DIM), ("2", FG), ("   last: ", DIM), ("3w ago", FG), ("   │", DIM)],
-    [("  └──────────────────────────────────────────────────────────┘", DIM)],
+    [span("  ┌─ ", DIM), span("warm path", GREEN), span(" ───────────────────────────────────────┐", DIM)],
+    [span("  │                                                          │", DIM)],
+    [span("  │    ", DIM), span("You", PRIMARY), span("  ─────→  ", DIM), span("Sarah Chen", FG), span("  ─────→  ", DIM), span("Eric Atiyeh", FG), span("   │", DIM)],
+    [span("  │    ", DIM), span("          ", FG), span("ex-Stripe  ", DIM), span("            ", FG), span("CTO, Ramp  ", DIM), span("   │", DIM)],
+    [span("  │    ", DIM), span("          ", FG), span("2019-2021  ", DIM), span("            ", FG), span("decision   ", DIM), span("   │", DIM)],
+    [span("  │                                                          │", DIM)],
+    [span("  │    ", DIM), span("strength: ", DIM), span("████████░░", PRIMARY), span("  82%", FG), span("   hops: ", DIM), span("2", FG), span("   last: ", DIM), span("3w ago", FG), span("   │", DIM)],
+    [span("  └──────────────────────────────────────────────────────────┘", DIM)],
 ], delay=8)
 
 add_pause(FPS * 3)
@@ -376,20 +673,20 @@ current_lines.append([])
 current_lines.append([])
 
 add_typing("# coming soon to Claude Code, Codex, and MCPs near you.", DIM, speed=1)
-current_lines.append(PROMPT + [("# coming soon to Claude Code, Codex, and MCPs near you.", DIM)])
+current_lines.append(PROMPT + [span("# coming soon to Claude Code, Codex, and MCPs near you.", DIM)])
 
 add_pause(FPS)
 
 # Type the line without wink first
 add_typing("# made for machines ... and humans", PRIMARY, speed=1)
-current_lines.append(PROMPT + [("# made for machines ... and humans", PRIMARY)])
+current_lines.append(PROMPT + [span("# made for machines ... and humans", PRIMARY)])
 
 # Dramatic pause before wink
 add_pause(FPS)
 
 # Animated wink: blink ;) on and off, then hold
-wink_line_with = PROMPT + [("# made for machines ... and humans ", PRIMARY), (";)", PRIMARY)]
-wink_line_without = PROMPT + [("# made for machines ... and humans", PRIMARY)]
+wink_line_with = PROMPT + [span("# made for machines ... and humans ", PRIMARY), span(";)", PRIMARY)]
+wink_line_without = PROMPT + [span("# made for machines ... and humans", PRIMARY)]
 
 # Pop in ;) with a blink effect
 for cycle in range(3):
@@ -399,14 +696,14 @@ for cycle in range(3):
         tgt = target_scroll(current_lines)
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y)
-        frames.append(f)
+        emit(f)
     # Hide wink
     current_lines[-1] = wink_line_without
     for _ in range(4):
         tgt = target_scroll(current_lines)
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y)
-        frames.append(f)
+        emit(f)
 
 # Hold with wink on
 current_lines[-1] = wink_line_with
@@ -417,24 +714,17 @@ add_pause(FPS * 4, blink=False)
 # ──── EXPORT ────
 # ═══════════════════════════════════════════
 
-frame_dir = tempfile.mkdtemp(prefix="kinobi_frames_")
-for i, frame in enumerate(frames):
-    frame.save(os.path.join(frame_dir, f"frame_{i:05d}.png"))
-
-mp4_path = "/Users/ankitpansari/Desktop/kinobi-landing/teaser.mp4"
-subprocess.run([
-    "ffmpeg", "-y",
-    "-framerate", str(FPS),
-    "-i", os.path.join(frame_dir, "frame_%05d.png"),
-    "-c:v", "libx264",
-    "-pix_fmt", "yuv420p",
-    "-crf", "12",
-    "-preset", "slow",
-    "-movflags", "+faststart",
-    mp4_path,
-], capture_output=True)
-
-shutil.rmtree(frame_dir)
-
-print(f"Generated {len(frames)} frames at {FPS}fps = {len(frames)/FPS:.1f}s")
-print(f"MP4: {mp4_path} ({os.path.getsize(mp4_path) / 1024:.0f}KB) — {W}x{H}")
+frame_queue.put(None)
+writer.join()
+try:
+    proc.stdin.close()
+except BrokenPipeError:
+    pass
+proc.wait()
+log_drain.join()
+if proc.returncode != 0:
+    sys.stderr.write(b"".join(ffmpeg_log).decode(errors="replace"))
+    sys.exit(f"ffmpeg exited with status {proc.returncode}")
+
+print(f"Generated {frame_count} frames at {FPS}fps = {frame_count/FPS:.1f}s")
+print(f"MP4: {mp4_path} ({os.path.getsize(mp4_path) / 1024:.0f}KB) — {OUT_W}x{OUT_H} (rendered at {W}x{H})")
@@ -1,19 +1,33 @@
-"""Generate teaser video with animated 木 prompt icon + keyboard sounds."""
+"""Generate teaser video with animated 木 prompt icon + keyboard sounds.
+
+Frames are plain Pillow, so on the render host the AVX2 build of
+Pillow-SIMD is a drop-in speedup for the text, fills and copies:
+
+    pip uninstall -y pillow
+    CC="cc -mavx2" pip install -U --force-reinstall pillow-simd
+"""
 
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import os
 import subprocess
 import tempfile
 import shutil
 import math
-import struct
+import queue
+import threading
 import wave
+from collections import namedtuple
+from functools import lru_cache
 
 # ── Config ──
-W, H = 3840, 2160  # 4K 16:9
-PAD_X = 112
-PAD_Y = 80
-TITLE_BAR_H = 96
+# Frames are drawn at 1080p and upscaled to the 4K master by ffmpeg — a
+# quarter of the pixels through every copy, paste, text draw and pipe write.
+W, H = 1920, 1080  # render size, 16:9
+OUT_W, OUT_H = 3840, 2160  # 4K output
+PAD_X = 56
+PAD_Y = 40
+TITLE_BAR_H = 48
 BG = (13, 13, 15)
 TITLE_BG = (30, 30, 34)
 FG = (230, 230, 230)
@@ -35,8 +49,8 @@ BAR_FG = PRIMARY
 # 木 color cycle for spinner
 CYCLE_COLORS = [PRIMARY, GREEN, CYAN, YELLOW]
 
-LINE_H = 92
-FONT_SIZE = 64
+LINE_H = 46
+FONT_SIZE = 32
 FPS = 24
 BLINK_INTERVAL = 12
 SCROLL_SPEED = 0.15
@@ -91,7 +105,7 @@ CHAR_W = bbox[2] - bbox[0]
 small_font = None
 for fp in FONT_PATHS:
     try:
-        small_font = ImageFont.truetype(fp, FONT_SIZE - 16)
+        small_font = ImageFont.truetype(fp, FONT_SIZE - 8)
         break
     except (OSError, IOError):
         continue
@@ -111,58 +125,72 @@ def breath_color(frame_i, speed=0.18):
     return lerp_color(dim_rose, PRIMARY, t)
 
 
+# The breathing pulse and the completion flash replay the same colours
+# every time — tabulate them once instead of per frame.
+BREATH_LUT_SIZE = 512  # frames (~21s), longer than any breathing pause
+BREATH_LUT = [breath_color(i) for i in range(BREATH_LUT_SIZE)]
+FLASH_FRAMES = 6
+FLASH_LUT = [lerp_color(WHITE, PRIMARY, i / (FLASH_FRAMES - 1))
+             for i in range(FLASH_FRAMES)]
+
+
 # ── Audio generation ──
 def generate_click():
     """Generate a single mechanical key click as raw samples."""
     n_samples = int(SAMPLE_RATE * CLICK_DURATION)
-    samples = []
-    for i in range(n_samples):
-        t = i / SAMPLE_RATE
-        # Sine wave with fast exponential decay
-        envelope = math.exp(-t * 200)
-        val = math.sin(2 * math.pi * CLICK_FREQ * t) * envelope * CLICK_VOLUME
-        # Add a small noise burst at the start for realism
-        if i < int(SAMPLE_RATE * 0.003):
-            noise = (((i * 1103515245 + 12345) >> 16) & 0x7FFF) / 32768.0 - 0.5
-            val += noise * 0.08 * envelope
-        samples.append(val)
+    i = np.arange(n_samples)
+    t = i / SAMPLE_RATE
+    # Sine wave with fast exponential decay
+    envelope = np.exp(-t * 200)
+    samples = np.sin(2 * np.pi * CLICK_FREQ * t) * envelope * CLICK_VOLUME
+    # Add a small noise burst at the start for realism
+    n_noise = int(SAMPLE_RATE * 0.003)
+    noise = (((i[:n_noise] * 1103515245 + 12345) >> 16) & 0x7FFF) / 32768.0 - 0.5
+    samples[:n_noise] += noise * 0.08 * envelope[:n_noise]
     return samples
 
 
+# Every keystroke plays the identical click — synthesize it once
+CLICK = generate_click()
+
+
 def generate_audio(total_frames, keystroke_frames, output_path):
     """Generate a WAV file with clicks at keystroke timestamps."""
     total_seconds = total_frames / FPS
     total_samples = int(total_seconds * SAMPLE_RATE)
-    audio = [0.0] * total_samples
-    click = generate_click()
+    # Mixed in float64 so the summed clicks round exactly as before
+    audio = np.zeros(total_samples)
+    click = CLICK
+    n = len(click)
 
     for frame_num in keystroke_frames:
         sample_pos = int((frame_num / FPS) * SAMPLE_RATE)
-        for i, val in enumerate(click):
-            idx = sample_pos + i
-            if idx < total_samples:
-                audio[idx] += val
-
-    # Clamp and write WAV
+        end = min(sample_pos + n, total_samples)
+        audio[sample_pos:end] += click[:end - sample_pos]
+
+    # Clamp and scale in place, then one cast to the PCM buffer — astype
+    # truncates toward zero, like int()
+    np.clip(audio, -1.0, 1.0, out=audio)
+    audio *= 32767
+    pcm = audio.astype("<i2")
     with wave.open(output_path, 'w') as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(SAMPLE_RATE)
-        for sample in audio:
-            clamped = max(-1.0, min(1.0, sample))
-            wf.writeframes(struct.pack('<h', int(clamped * 32767)))
+        wf.writeframes(pcm.tobytes())
 
 
 # ── Scrolling viewport ──
 scroll_y = 0.0
 
 
-def content_bottom(lines):
-    return len(lines) * LINE_H
+def content_bottom(n_lines):
+    return n_lines * LINE_H
 
 
-def target_scroll(lines):
-    content_h = content_bottom(lines)
+def target_scroll(n_lines):
+    """Scroll that keeps the last of n_lines lines in view."""
+    content_h = content_bottom(n_lines)
     viewport_h = H - TITLE_BAR_H - PAD_Y * 2
     target = max(0, content_h - viewport_h + LINE_H * 2)
     return target
@@ -178,33 +206,155 @@ def smooth_scroll(current, target):
 def draw_title_bar(draw):
     draw.rectangle([0, 0, W, TITLE_BAR_H], fill=TITLE_BG)
     dot_y = TITLE_BAR_H // 2
-    dot_r = 14
-    dot_x_start = 48
-    dot_gap = 48
+    dot_r = 7
+    dot_x_start = 24
+    dot_gap = 24
     for i, c in enumerate([(255, 95, 86), (255, 189, 46), (39, 201, 63)]):
         cx = dot_x_start + i * dot_gap
         draw.ellipse([cx - dot_r, dot_y - dot_r, cx + dot_r, dot_y + dot_r], fill=c)
 
 
+# Title bar rasterized once (the rectangle is inclusive of row TITLE_BAR_H)
+_TITLE_STRIP = Image.new("RGB", (W, TITLE_BAR_H + 1), BG)
+draw_title_bar(ImageDraw.Draw(_TITLE_STRIP))
+
+
+# Text atlas — every (run of text, font) pair is rasterized once into an
+# alpha mask, so drawing a span is one colour paste instead of a
+# draw.text walking FreeType again.
+TEXT_MASKS = {}
+
+
+def text_mask(text, fnt):
+    """(mask, left, top) for one run of text."""
+    m = TEXT_MASKS.get((text, fnt))
+    if m is None:
+        left, top, right, bottom = fnt.getbbox(text)
+        mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=fnt)
+        m = TEXT_MASKS[(text, fnt)] = (mask, left, top)
+    return m
+
+
+def blit_text(img, xy, text, color, fnt=None):
+    """Same pixels as draw.text at integer coordinates, from the atlas.
+
+    fnt defaults to the CJK font for runs containing 木, else the mono font.
+    """
+    if text:
+        if fnt is None:
+            fnt = cjk_font if PROMPT_ICON in text else font
+        mask, left, top = text_mask(text, fnt)
+        img.paste(color, (xy[0] + left, xy[1] + top), mask)
+
+
+@lru_cache(maxsize=256)
+def line_strip(parts):
+    """A line's spans rasterized once onto a BG tile cropped to the ink.
+
+    parts is a tuple of (text, color) with any 木 colour override already
+    applied. Returns (tile, spill): tile is the opaque LINE_H band, spill
+    the (x, y, color, mask) pieces of ink that reach past it — box-drawing
+    glyphs in the Menlo/DejaVu family sit a pixel above the line origin.
+    """
+    x = 0
+    tile_w = 1
+    for text, color in parts:
+        if text:
+            fnt = cjk_font if PROMPT_ICON in text else font
+            tile_w = max(tile_w, x + fnt.getbbox(text)[2])
+        x += len(text) * CHAR_W
+    tile = Image.new("RGB", (min(tile_w, W - PAD_X), LINE_H), BG)
+    spill = []
+    x = 0
+    for text, color in parts:
+        if text:
+            blit_text(tile, (x, 0), text, color)
+            fnt = cjk_font if PROMPT_ICON in text else font
+            mask, left, top = text_mask(text, fnt)
+            if top < 0:
+                spill.append((x + left, top, color,
+                              mask.crop((0, 0, mask.width, -top))))
+            if top + mask.height > LINE_H:
+                spill.append((x + left, LINE_H, color,
+                              mask.crop((0, LINE_H - top, mask.width, mask.height))))
+        x += len(text) * CHAR_W
+    return tile, tuple(spill)
+
+
+# Base layer — background, committed lines and title bar for the current
+# lines, scroll position and 木 colour. While typing only the cursor line
+# changes, so each frame is this plus the cursor line and block.
+# Both buffers are allocated once and overwritten in place — never an
+# Image.new or copy per frame.
+_base = Image.new("RGB", (W, H), BG)
+_base_key = None
+_canvas = Image.new("RGB", (W, H), BG)
+_canvas_draw = ImageDraw.Draw(_canvas)
+_canvas_key = None  # content key of the frame currently on _canvas
+
+
+def render_base(lines_key, base_y, prompt_color_override):
+    """Background with the committed lines pasted at base_y."""
+    global _base_key
+    key = (lines_key, base_y, prompt_color_override)
+    if key == _base_key:
+        return _base
+    img = _base
+    img.paste(BG, (0, 0, W, H))
+    # Only lines inside the viewport: TITLE_BAR_H - LINE_H <= y <= H
+    first_idx = max(0, -((base_y - TITLE_BAR_H + LINE_H) // LINE_H))
+    last_idx = min(len(lines_key), (H - base_y) // LINE_H + 1)
+    spill = []
+    for idx in range(first_idx, last_idx):
+        parts = lines_key[idx]
+        y = base_y + idx * LINE_H
+        if prompt_color_override:
+            parts = tuple((text, prompt_color_override if text == PROMPT_ICON + " " else color)
+                          for text, color in parts)
+        tile, line_spill = line_strip(parts)
+        img.paste(tile, (PAD_X, y))
+        spill += [(PAD_X + x, y + dy, color, mask) for x, dy, color, mask in line_spill]
+    # Spill goes on once every opaque tile is down, so none of them covers
+    # a neighbour's overhang
+    for x, y, color, mask in spill:
+        img.paste(color, (x, y), mask)
+    # Title bar over any line scrolled up under it. The cursor and spinner
+    # only draw from TITLE_BAR_H down, so per-frame layers never cover it.
+    img.paste(_TITLE_STRIP, (0, 0))
+    _base_key = key
+    return img
+
+
+def cursor_box(x, y):
+    """Paste box of the cursor block — a plain fill, no ImageDraw dispatch."""
+    return (x, y + 4, x + CHAR_W - 3, y + LINE_H - 7)
+
+
 def render_frame(lines, scroll_offset, cursor_parts=None, cursor_visible=True,
-                 extra_draw=None, prompt_color_override=None):
-    img = Image.new("RGB", (W, H), BG)
-    draw = ImageDraw.Draw(img)
+                 spinner=None, prompt_color_override=None):
+    """Render a frame onto the shared canvas and return it.
+
+    spinner is a SpinnerSpec drawn on the two rows below the content.
+
+    The canvas is overwritten by the next call — emit it before rendering
+    again. Pauses, holds and the wink repeat the same picture, so a frame
+    whose content matches what is already on the canvas is returned as is.
+    """
+    global _canvas_key
+    lines_key = tuple(map(tuple, lines))
+    key = (lines_key, int(scroll_offset),
+           cursor_visible and cursor_parts is not None,
+           None if cursor_parts is None else tuple(cursor_parts),
+           spinner, prompt_color_override)
+    if key == _canvas_key:
+        return _canvas
+    _canvas_key = key
 
     base_y = TITLE_BAR_H + PAD_Y - int(scroll_offset)
-    for idx, parts in enumerate(lines):
-        y = base_y + idx * LINE_H
-        if y < TITLE_BAR_H - LINE_H or y > H:
-            continue
-        x = PAD_X
-        for text, color in parts:
-            if prompt_color_override and text == PROMPT_ICON + " ":
-                color = prompt_color_override
-            if PROMPT_ICON in text:
-                draw.text((x, y), text, fill=color, font=cjk_font)
-            else:
-                draw.text((x, y), text, fill=color, font=font)
-            x += len(text) * CHAR_W
+    img = _canvas
+    draw = _canvas_draw
+    img.paste(render_base(lines_key, base_y, prompt_color_override), (0, 0))
 
     if cursor_visible and cursor_parts is not None:
         cursor_line_idx = len(lines)
@@ -215,34 +365,87 @@ def render_frame(lines, scroll_offset, cursor_parts=None, cursor_visible=True,
                 for text, color in cursor_parts:
                     if prompt_color_override and text == PROMPT_ICON + " ":
                         color = prompt_color_override
-                    if PROMPT_ICON in text:
-                        draw.text((x, y), text, fill=color, font=cjk_font)
-                    else:
-                        draw.text((x, y), text, fill=color, font=font)
+                    blit_text(img, (x, y), text, color)
                     x += len(text) * CHAR_W
-                draw.rectangle([x, y + 8, x + CHAR_W - 8, y + LINE_H - 16],
-                               fill=CURSOR_COLOR)
+                img.paste(CURSOR_COLOR, cursor_box(x, y))
         else:
             y = base_y + len(lines) * LINE_H
             if TITLE_BAR_H <= y <= H:
                 x = PAD_X
-                draw.rectangle([x, y + 8, x + CHAR_W - 8, y + LINE_H - 16],
-                               fill=CURSOR_COLOR)
+                img.paste(CURSOR_COLOR, cursor_box(x, y))
 
-    if extra_draw:
-        extra_draw(draw, base_y, len(lines))
-
-    draw.rectangle([0, 0, W, TITLE_BAR_H], fill=TITLE_BG)
-    draw_title_bar(draw)
+    if spinner:
+        draw_spinner(img, draw, base_y, len(lines), spinner)
 
     return img
 
 
+# ── Encoder ──
+# Frames stream into ffmpeg as they are rendered — only a few are ever
+# resident. The audio is muxed in afterwards from keystroke_frames.
+
+# At -crf 12 the stream is already near-lossless; -preset slow bought a few
+# percent of bitrate for 2-3x the encode time. FAST=1 trades quality for
+# turnaround when iterating on the script.
+if os.environ.get("FAST") == "1":
+    X264_ARGS = ["-crf", "18", "-preset", "ultrafast"]
+else:
+    X264_ARGS = ["-crf", "12", "-preset", "medium"]
+
+work_dir = tempfile.mkdtemp(prefix="kinobi_")
+silent_path = os.path.join(work_dir, "silent.mp4")
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo",
+    "-pix_fmt", "rgb24",
+    "-s", f"{W}x{H}",
+    "-framerate", str(FPS),
+    "-i", "-",
+    "-vf", f"scale={OUT_W}:{OUT_H}:flags=lanczos",
+    "-c:v", "libx264",
+    "-pix_fmt", "yuv420p",
+    *X264_ARGS,
+    silent_path,
+], stdin=subprocess.PIPE, stderr=subprocess.DEVNULL)
+frame_count = 0
+
+# Pipe writes run on a background thread (the GIL is released while ffmpeg
+# drains the pipe), so rendering the next frame overlaps sending this one.
+# Bounded so only a few raw frames are ever in flight — which also keeps
+# frame buffers alive across allocations, instead of glibc mapping and
+# page-faulting a fresh one for every frame.
+frame_queue = queue.Queue(maxsize=4)
+
+
+def pipe_writer():
+    while True:
+        buf = frame_queue.get()
+        if buf is None:
+            break
+        try:
+            proc.stdin.write(buf)
+        except BrokenPipeError:
+            pass  # ffmpeg died; keep draining so emit() never blocks
+
+
+writer = threading.Thread(target=pipe_writer, daemon=True)
+writer.start()
+
+
+def emit(img, is_keystroke=False):
+    """Queue one frame for the encoder, noting keystroke frames for the audio."""
+    global frame_count
+    if is_keystroke:
+        keystroke_frames.append(frame_count)
+    # Snapshot now: the canvas is overwritten by the next render_frame
+    frame_queue.put(img.tobytes())
+    frame_count += 1
+
+
 # ── Frame helpers ──
 PROMPT = [(PROMPT_ICON + " ", PROMPT_COLOR)]
 NO_PROMPT = []  # for opening comment lines
 
-frames = []
 current_lines = []
 
 
@@ -253,47 +456,44 @@ def add_typing(text, color, prompt=True, speed=1, use_prompt=True):
     for i in range(len(text)):
         partial = text[:i+1]
         cursor_parts = prefix + [(partial, color)]
-        tgt = target_scroll(current_lines + [cursor_parts])
+        tgt = target_scroll(len(current_lines) + 1)
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y, cursor_parts=cursor_parts)
         if i % speed == 0:
-            keystroke_frames.append(len(frames))
-            frames.append(f)
+            emit(f, is_keystroke=True)
 
 
 def add_pause(n_frames, blink=True):
     global scroll_y
     for i in range(n_frames):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         vis = (i // BLINK_INTERVAL) % 2 == 0 if blink else True
         cursor = list(PROMPT)
         f = render_frame(current_lines, scroll_y,
                          cursor_parts=cursor, cursor_visible=vis)
-        frames.append(f)
+        emit(f)
 
 
 def add_pause_no_prompt(n_frames, blink=True):
     """Pause without 木 prompt (for opening section)."""
     global scroll_y
     for i in range(n_frames):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         vis = (i // BLINK_INTERVAL) % 2 == 0 if blink else True
         f = render_frame(current_lines, scroll_y,
                          cursor_parts=[], cursor_visible=vis)
-        frames.append(f)
+        emit(f)
 
 
-def add_flash(n_frames=6):
+def add_flash():
     global scroll_y
-    for i in range(n_frames):
-        t = i / max(n_frames - 1, 1)
-        flash_color = lerp_color(WHITE, PRIMARY, t)
-        tgt = target_scroll(current_lines)
+    for flash_color in FLASH_LUT:
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y, prompt_color_override=flash_color)
-        frames.append(f)
+        emit(f)
 
 
 def add_output_lines(output, delay=3, flash=True):
@@ -301,14 +501,54 @@ def add_output_lines(output, delay=3, flash=True):
     for line in output:
         current_lines.append(line)
         for _ in range(delay):
-            tgt = target_scroll(current_lines)
+            tgt = target_scroll(len(current_lines))
             scroll_y = smooth_scroll(scroll_y, tgt)
             f = render_frame(current_lines, scroll_y)
-            frames.append(f)
+            emit(f)
     if flash:
         add_flash()
 
 
+# Progress bar sprite — the rounded bar rasterized once as a hard-edged
+# mask and pasted with a colour fill. A partial fill is the bar's left
+# part plus its right cap moved in.
+BAR_W = 440
+BAR_H = 18
+BAR_RADIUS = 5
+BAR_MASK = Image.new("L", (BAR_W + 1, BAR_H + 1), 0)
+ImageDraw.Draw(BAR_MASK).rounded_rectangle([0, 0, BAR_W, BAR_H],
+                                           radius=BAR_RADIUS, fill=255)
+BAR_CAP = BAR_MASK.crop((BAR_W - 2 * BAR_RADIUS, 0, BAR_W + 1, BAR_H + 1))
+
+# Everything one spinner frame draws — plain hashable data, so spinner
+# frames key the canvas like any other frame.
+SpinnerSpec = namedtuple("SpinnerSpec", "progress cycle_color status_text pct")
+
+
+def draw_spinner(img, draw, base_y, n_lines, spec):
+    """Spinner line with the colour-cycling 木, and the progress bar below."""
+    y1 = base_y + n_lines * LINE_H
+    if TITLE_BAR_H <= y1 <= H:
+        x = PAD_X + 2 * CHAR_W
+        blit_text(img, (x, y1), PROMPT_ICON + " ", spec.cycle_color, cjk_font)
+        blit_text(img, (x + 2 * CHAR_W, y1), spec.status_text, DIM, font)
+    y2 = base_y + (n_lines + 1) * LINE_H
+    if TITLE_BAR_H <= y2 <= H:
+        bar_x = PAD_X + 2 * CHAR_W
+        bar_y = y2 + (LINE_H - BAR_H) // 2
+        img.paste(BAR_BG, (bar_x, bar_y), BAR_MASK)
+        fill_w = int(BAR_W * spec.progress)
+        if fill_w > 3 * BAR_RADIUS:
+            body = BAR_MASK.crop((0, 0, fill_w - 2 * BAR_RADIUS, BAR_H + 1))
+            img.paste(spec.cycle_color, (bar_x, bar_y), body)
+            img.paste(spec.cycle_color, (bar_x + fill_w - 2 * BAR_RADIUS, bar_y), BAR_CAP)
+        elif fill_w > BAR_RADIUS:
+            # Too short for body + cap to meet — rasterize it directly
+            draw.rounded_rectangle([bar_x, bar_y, bar_x + fill_w, bar_y + BAR_H],
+                               radius=BAR_RADIUS, fill=spec.cycle_color)
+        blit_text(img, (bar_x + BAR_W + 16, y2), f"{spec.pct}%", DIM, small_font)
+
+
 def add_spinner_progress(status_text, n_frames=36,
                           progress_start=0.0, progress_end=1.0):
     global scroll_y
@@ -317,46 +557,27 @@ def add_spinner_progress(status_text, n_frames=36,
         cycle_color = CYCLE_COLORS[i % len(CYCLE_COLORS)]
         pct = int(progress * 100)
 
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt + LINE_H * 3)
 
-        def draw_extra(draw, base_y, n_lines, p=progress, cc=cycle_color, st=status_text, pc=pct):
-            y1 = base_y + n_lines * LINE_H
-            if TITLE_BAR_H <= y1 <= H:
-                x = PAD_X + 2 * CHAR_W
-                draw.text((x, y1), PROMPT_ICON + " ", fill=cc, font=cjk_font)
-                draw.text((x + 2 * CHAR_W, y1), st, fill=DIM, font=font)
-            y2 = base_y + (n_lines + 1) * LINE_H
-            if TITLE_BAR_H <= y2 <= H:
-                bar_x = PAD_X + 2 * CHAR_W
-                bar_h = 36
-                bar_w = 880
-                bar_y = y2 + (LINE_H - bar_h) // 2
-                draw.rounded_rectangle([bar_x, bar_y, bar_x + bar_w, bar_y + bar_h],
-                                        radius=10, fill=BAR_BG)
-                fill_w = int(bar_w * p)
-                if fill_w > 10:
-                    draw.rounded_rectangle([bar_x, bar_y, bar_x + fill_w, bar_y + bar_h],
-                                            radius=10, fill=cc)
-                draw.text((bar_x + bar_w + 32, y2), f"{pc}%", fill=DIM, font=small_font)
-
-        f = render_frame(current_lines, scroll_y, extra_draw=draw_extra,
+        spec = SpinnerSpec(progress, cycle_color, status_text, pct)
+        f = render_frame(current_lines, scroll_y, spinner=spec,
                          prompt_color_override=cycle_color)
-        frames.append(f)
+        emit(f)
 
 
 def add_breathing_pause(n_frames):
     """Pause with 木 breathing — dramatic pulse between near-black and full rose."""
     global scroll_y
     for i in range(n_frames):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
-        bc = breath_color(i)
+        bc = BREATH_LUT[i % BREATH_LUT_SIZE]
         # Also pulse the standalone 木 signoff line color
         if current_lines and len(current_lines[-1]) == 1 and current_lines[-1][0][0] == PROMPT_ICON:
             current_lines[-1] = [(PROMPT_ICON, bc)]
         f = render_frame(current_lines, scroll_y, prompt_color_override=bc)
-        frames.append(f)
+        emit(f)
 
 
 # ═══════════════════════════════════════════
@@ -510,16 +731,16 @@ wink_line_without = PROMPT + [("# made for machines ... and humans", PRIMARY)]
 for cycle in range(3):
     current_lines[-1] = wink_line_with
     for _ in range(5):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y)
-        frames.append(f)
+        emit(f)
     current_lines[-1] = wink_line_without
     for _ in range(4):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y)
-        frames.append(f)
+        emit(f)
 
 # Hold with wink on
 current_lines[-1] = wink_line_with
@@ -535,29 +756,19 @@ add_breathing_pause(FPS * 4)
 # ──── EXPORT ────
 # ═══════════════════════════════════════════
 
-print(f"Rendering {len(frames)} frames...")
-
-frame_dir = tempfile.mkdtemp(prefix="kinobi_frames_")
-for i, frame in enumerate(frames):
-    frame.save(os.path.join(frame_dir, f"frame_{i:05d}.png"))
+print(f"Encoding {frame_count} frames...")
+frame_queue.put(None)
+writer.join()
+try:
+    proc.stdin.close()
+except BrokenPipeError:
+    pass
 
-# Generate audio track
-wav_path = os.path.join(frame_dir, "keystrokes.wav")
+# Generate audio track while ffmpeg finishes encoding the tail
+wav_path = os.path.join(work_dir, "keystrokes.wav")
 print(f"Generating audio ({len(keystroke_frames)} keystrokes)...")
-generate_audio(len(frames), keystroke_frames, wav_path)
-
-# Encode silent video first
-silent_path = os.path.join(frame_dir, "silent.mp4")
-subprocess.run([
-    "ffmpeg", "-y",
-    "-framerate", str(FPS),
-    "-i", os.path.join(frame_dir, "frame_%05d.png"),
-    "-c:v", "libx264",
-    "-pix_fmt", "yuv420p",
-    "-crf", "12",
-    "-preset", "slow",
-    silent_path,
-], capture_output=True)
+generate_audio(frame_count, keystroke_frames, wav_path)
+proc.wait()
 
 # Merge video + audio
 mp4_path = "/Users/ankitpansari/Desktop/kinobi-landing/teaser_v4.mp4"
@@ -573,8 +784,8 @@ subprocess.run([
     mp4_path,
 ], capture_output=True)
 
-shutil.rmtree(frame_dir)
+shutil.rmtree(work_dir)
 
-print(f"Generated {len(frames)} frames at {FPS}fps = {len(frames)/FPS:.1f}s")
+print(f"Generated {frame_count} frames at {FPS}fps = {frame_count/FPS:.1f}s")
 print(f"Keystrokes: {len(keystroke_frames)}")
-print(f"MP4: {mp4_path} ({os.path.getsize(mp4_path) / 1024:.0f}KB) — {W}x{H}")
+print(f"MP4: {mp4_path} ({os.path.getsize(mp4_path) / 1024:.0f}KB) — {OUT_W}x{OUT_H} (rendered at {W}x{H})")
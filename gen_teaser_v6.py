@@ -1,19 +1,23 @@
 """Generate teaser video v6 — minimal Japanese-inspired audio."""
 
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import os
 import subprocess
 import tempfile
 import shutil
 import math
-import struct
 import wave
+from functools import lru_cache
 
 # ── Config ──
-W, H = 3840, 2160  # 4K 16:9
-PAD_X = 112
-PAD_Y = 80
-TITLE_BAR_H = 96
+# Frames are drawn at 1080p and upscaled to the 4K master by ffmpeg — a
+# quarter of the pixels through every copy, paste, text draw and pipe write.
+W, H = 1920, 1080  # render size, 16:9
+OUT_W, OUT_H = 3840, 2160  # 4K output
+PAD_X = 56
+PAD_Y = 40
+TITLE_BAR_H = 48
 BG = (13, 13, 15)
 TITLE_BG = (30, 30, 34)
 FG = (230, 230, 230)
@@ -34,8 +38,8 @@ BAR_FG = PRIMARY
 
 CYCLE_COLORS = [PRIMARY, GREEN, CYAN, YELLOW]
 
-LINE_H = 92
-FONT_SIZE = 64
+LINE_H = 46
+FONT_SIZE = 32
 FPS = 24
 BLINK_INTERVAL = 12
 SCROLL_SPEED = 0.15
@@ -97,7 +101,7 @@ CHAR_W = bbox[2] - bbox[0]
 small_font = None
 for fp in FONT_PATHS:
     try:
-        small_font = ImageFont.truetype(fp, FONT_SIZE - 16)
+        small_font = ImageFont.truetype(fp, FONT_SIZE - 8)
         break
     except (OSError, IOError):
         continue
@@ -121,28 +125,26 @@ def generate_tok_samples():
     """Shishi-odoshi: hollow bamboo knock.
     Two layered tones with fast decay — sounds like wood hitting wood."""
     n = int(SAMPLE_RATE * TOK_DURATION)
-    samples = []
-    for i in range(n):
-        t = i / SAMPLE_RATE
-        # Fast exponential decay
-        env = math.exp(-t * 60)
-        # Primary resonance — hollow wood body
-        val = math.sin(2 * math.pi * 400 * t) * env * 0.6
-        # Higher knock transient
-        val += math.sin(2 * math.pi * 1100 * t) * math.exp(-t * 120) * 0.4
-        # Very brief noise burst at attack
-        if i < int(SAMPLE_RATE * 0.004):
-            noise = (((i * 1103515245 + 12345) >> 16) & 0x7FFF) / 32768.0 - 0.5
-            val += noise * 0.5 * math.exp(-t * 300)
-        samples.append(val * TOK_VOLUME)
-    return samples
+    i = np.arange(n)
+    t = i / SAMPLE_RATE
+    # Fast exponential decay
+    env = np.exp(-t * 60)
+    # Primary resonance — hollow wood body
+    val = np.sin(2 * np.pi * 400 * t) * env * 0.6
+    # Higher knock transient
+    val += np.sin(2 * np.pi * 1100 * t) * np.exp(-t * 120) * 0.4
+    # Very brief noise burst at attack
+    n_noise = int(SAMPLE_RATE * 0.004)
+    noise = (((i[:n_noise] * 1103515245 + 12345) >> 16) & 0x7FFF) / 32768.0 - 0.5
+    val[:n_noise] += noise * 0.5 * np.exp(-t[:n_noise] * 300)
+    return val * TOK_VOLUME
 
 
 def generate_bell_samples():
     """Temple bell (orin): warm singing bowl with long sustain.
     Multiple harmonics that decay at different rates — shimmering resonance."""
     n = int(SAMPLE_RATE * BELL_DURATION)
-    samples = []
+    t = np.arange(n) / SAMPLE_RATE
     # Fundamental + harmonics of a singing bowl
     harmonics = [
         (528, 1.0, 1.2),    # fundamental — C5, slow decay
@@ -150,62 +152,63 @@ def generate_bell_samples():
         (1584, 0.15, 3.0),  # 3rd harmonic, faster decay
         (2640, 0.06, 5.0),  # 5th harmonic, fast shimmer
     ]
-    for i in range(n):
-        t = i / SAMPLE_RATE
-        val = 0
-        for freq, amp, decay_rate in harmonics:
-            env = math.exp(-t * decay_rate)
-            val += math.sin(2 * math.pi * freq * t) * amp * env
-        # Soft attack
-        attack = min(1.0, t / 0.008)
-        # Subtle beating between close frequencies for realism
-        beat = 1.0 + 0.02 * math.sin(2 * math.pi * 1.5 * t)
-        samples.append(val * attack * beat * BELL_VOLUME)
-    return samples
+    val = np.zeros(n)
+    for freq, amp, decay_rate in harmonics:
+        env = np.exp(-t * decay_rate)
+        val += np.sin(2 * np.pi * freq * t) * amp * env
+    # Soft attack
+    attack = np.minimum(1.0, t / 0.008)
+    # Subtle beating between close frequencies for realism
+    beat = 1.0 + 0.02 * np.sin(2 * np.pi * 1.5 * t)
+    return val * attack * beat * BELL_VOLUME
+
+
+def mix_at(audio, samples, frame_nums):
+    """Add samples into audio at each frame's timestamp, clipped at the end."""
+    # Sample offsets for the whole schedule at once; astype truncates
+    # like int(). Only a handful of events, so the adds stay slices.
+    positions = (np.asarray(frame_nums, dtype=np.float64) / FPS * SAMPLE_RATE).astype(np.int64)
+    for pos in positions:
+        end = min(pos + len(samples), len(audio))
+        audio[pos:end] += samples[:end - pos]
 
 
 def generate_audio(total_frames, output_path):
     """Generate WAV with bamboo toks and temple bell."""
     total_seconds = total_frames / FPS
     total_samples = int(total_seconds * SAMPLE_RATE)
-    audio = [0.0] * total_samples
+    # Mixed in float64 so the summed sounds round exactly as before
+    audio = np.zeros(total_samples)
 
     tok = generate_tok_samples()
     bell = generate_bell_samples()
 
-    for frame_num in tok_frames:
-        pos = int((frame_num / FPS) * SAMPLE_RATE)
-        for i, val in enumerate(tok):
-            idx = pos + i
-            if idx < total_samples:
-                audio[idx] += val
-
-    for frame_num in bell_frames:
-        pos = int((frame_num / FPS) * SAMPLE_RATE)
-        for i, val in enumerate(bell):
-            idx = pos + i
-            if idx < total_samples:
-                audio[idx] += val
+    mix_at(audio, tok, tok_frames)
+    mix_at(audio, bell, bell_frames)
 
+    # Clamp and scale the whole track at once, then one cast — astype
+    # truncates toward zero, like int()
+    np.clip(audio, -1.0, 1.0, out=audio)
+    audio *= 32767
+    pcm = audio.astype("<i2")
     with wave.open(output_path, 'w') as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(SAMPLE_RATE)
-        for sample in audio:
-            clamped = max(-1.0, min(1.0, sample))
-            wf.writeframes(struct.pack('<h', int(clamped * 32767)))
+        wf.writeframes(pcm.tobytes())
 
 
 # ── Scrolling viewport ──
 scroll_y = 0.0
 
 
-def content_bottom(lines):
-    return len(lines) * LINE_H
+def content_bottom(n_lines):
+    return n_lines * LINE_H
 
 
-def target_scroll(lines):
-    content_h = content_bottom(lines)
+def target_scroll(n_lines):
+    """Scroll that keeps the last of n_lines lines in view."""
+    content_h = content_bottom(n_lines)
     viewport_h = H - TITLE_BAR_H - PAD_Y * 2
     return max(0, content_h - viewport_h + LINE_H * 2)
 
@@ -220,32 +223,156 @@ def smooth_scroll(current, target):
 def draw_title_bar(draw):
     draw.rectangle([0, 0, W, TITLE_BAR_H], fill=TITLE_BG)
     dot_y = TITLE_BAR_H // 2
-    dot_r = 14
+    dot_r = 7
     for i, c in enumerate([(255, 95, 86), (255, 189, 46), (39, 201, 63)]):
-        cx = 48 + i * 48
+        cx = 24 + i * 24
         draw.ellipse([cx - dot_r, dot_y - dot_r, cx + dot_r, dot_y + dot_r], fill=c)
 
 
+# Text atlas — every (run of text, font) pair is rasterized once into an
+# alpha mask, so drawing a span is one colour paste instead of a
+# draw.text walking FreeType again.
+TEXT_MASKS = {}
+
+
+def text_mask(text, fnt):
+    """(mask, left, top) for one run of text."""
+    m = TEXT_MASKS.get((text, fnt))
+    if m is None:
+        left, top, right, bottom = fnt.getbbox(text)
+        mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=fnt)
+        m = TEXT_MASKS[(text, fnt)] = (mask, left, top)
+    return m
+
+
+# Default-font masks by text alone — the CJK-or-mono choice is made once
+# per distinct run rather than by a substring scan on every draw.
+RUN_MASKS = {}
+
+
+def blit_text(img, xy, text, color, fnt=None):
+    """Same pixels as draw.text at integer coordinates, from the atlas.
+
+    fnt defaults to the CJK font for runs containing 木, else the mono font.
+    """
+    if text:
+        if fnt is None:
+            m = RUN_MASKS.get(text)
+            if m is None:
+                fnt = cjk_font if PROMPT_ICON in text else font
+                m = RUN_MASKS[text] = text_mask(text, fnt)
+        else:
+            m = text_mask(text, fnt)
+        mask, left, top = m
+        img.paste(color, (xy[0] + left, xy[1] + top), mask)
+
+
+@lru_cache(maxsize=256)
+def line_strip(parts):
+    """A line's spans rasterized once onto a BG tile cropped to the ink.
+
+    parts is a tuple of (text, color) with any signoff colour already
+    applied. Returns (tile, spill): tile is the opaque LINE_H band, spill
+    the (x, y, color, mask) pieces of ink that reach past it — box-drawing
+    glyphs in the Menlo/DejaVu family sit a pixel above the line origin.
+    """
+    x = 0
+    tile_w = 1
+    for text, color in parts:
+        if text:
+            fnt = cjk_font if PROMPT_ICON in text else font
+            tile_w = max(tile_w, x + fnt.getbbox(text)[2])
+        x += len(text) * CHAR_W
+    tile = Image.new("RGB", (min(tile_w, W - PAD_X), LINE_H), BG)
+    spill = []
+    x = 0
+    for text, color in parts:
+        if text:
+            blit_text(tile, (x, 0), text, color)
+            fnt = cjk_font if PROMPT_ICON in text else font
+            mask, left, top = text_mask(text, fnt)
+            if top < 0:
+                spill.append((x + left, top, color,
+                              mask.crop((0, 0, mask.width, -top))))
+            if top + mask.height > LINE_H:
+                spill.append((x + left, LINE_H, color,
+                              mask.crop((0, LINE_H - top, mask.width, mask.height))))
+        x += len(text) * CHAR_W
+    return tile, tuple(spill)
+
+
+_bg = Image.new("RGB", (W, H), BG)
+_bg_key = None
+
+
+def render_background(lines_key, base_y):
+    """BG with the committed lines at base_y, rebuilt only when either changes."""
+    global _bg_key
+    key = (lines_key, base_y)
+    if key == _bg_key:
+        return _bg
+    img = _bg
+    img.paste(BG, (0, 0, W, H))
+    # Only lines inside the viewport: TITLE_BAR_H - LINE_H <= y <= H
+    first_idx = max(0, -((base_y - TITLE_BAR_H + LINE_H) // LINE_H))
+    last_idx = min(len(lines_key), (H - base_y) // LINE_H + 1)
+    spill = []
+    for idx in range(first_idx, last_idx):
+        parts = lines_key[idx]
+        if parts:
+            y = base_y + idx * LINE_H
+            tile, line_spill = line_strip(parts)
+            img.paste(tile, (PAD_X, y))
+            spill += [(PAD_X + x, y + dy, color, mask) for x, dy, color, mask in line_spill]
+    # Spill goes on once every opaque tile is down, so none of them covers
+    # a neighbour's overhang
+    for x, y, color, mask in spill:
+        img.paste(color, (x, y), mask)
+    _bg_key = key
+    return img
+
+
+# The one frame buffer, reused for every frame — emit snapshots it with
+# tobytes() before the next render overwrites it. Holds and converged
+# pauses render the same picture many times over, so a frame whose content
+# key matches what the canvas already shows is returned untouched, and
+# _canvas_version only moves when the pixels actually change.
+_canvas = Image.new("RGB", (W, H), BG)
+_canvas_draw = ImageDraw.Draw(_canvas)
+_canvas_key = None
+_canvas_version = 0
+
+
 def render_frame(lines, scroll_offset, cursor_parts=None, cursor_visible=True,
                  extra_draw=None, signoff_color=None):
-    img = Image.new("RGB", (W, H), BG)
-    draw = ImageDraw.Draw(img)
-
+    global _canvas_key, _canvas_version
     base_y = TITLE_BAR_H + PAD_Y - int(scroll_offset)
-    for idx, parts in enumerate(lines):
-        y = base_y + idx * LINE_H
-        if y < TITLE_BAR_H - LINE_H or y > H:
-            continue
-        x = PAD_X
-        is_signoff = (len(parts) == 1 and parts[0][0] == PROMPT_ICON)
-        for text, color in parts:
-            if is_signoff and signoff_color:
-                color = signoff_color
-            if PROMPT_ICON in text:
-                draw.text((x, y), text, fill=color, font=cjk_font)
-            else:
-                draw.text((x, y), text, fill=color, font=font)
-            x += len(text) * CHAR_W
+    lines_key = tuple(tuple(parts) for parts in lines)
+    # extra_draw closures can't be compared, so overlay frames always render
+    key = None
+    if extra_draw is None:
+        cursor_key = tuple(cursor_parts) if cursor_parts is not None else None
+        key = (lines_key, base_y, cursor_key, cursor_visible, signoff_color)
+        if key == _canvas_key:
+            return _canvas
+    img = _canvas
+    img.paste(render_background(lines_key, base_y), (0, 0))
+    draw = _canvas_draw
+
+    if signoff_color:
+        # Repaint only the standalone signoff glyph (single 木 with no space
+        # suffix): its ink stays inside its own row, so clearing the glyph
+        # box back to BG and blitting the new colour matches a full redraw.
+        mask, left, top = text_mask(PROMPT_ICON, cjk_font)
+        first_idx = max(0, -((base_y - TITLE_BAR_H + LINE_H) // LINE_H))
+        last_idx = min(len(lines), (H - base_y) // LINE_H + 1)
+        for idx in range(first_idx, last_idx):
+            parts = lines[idx]
+            if len(parts) == 1 and parts[0][0] == PROMPT_ICON:
+                gx, gy = PAD_X + left, base_y + idx * LINE_H + top
+                img.paste(BG, (gx, gy, gx + mask.width, gy + mask.height))
+                img.paste(signoff_color, (gx, gy), mask)
 
     if cursor_visible and cursor_parts is not None:
         cursor_line_idx = len(lines)
@@ -254,33 +381,86 @@ def render_frame(lines, scroll_offset, cursor_parts=None, cursor_visible=True,
             if TITLE_BAR_H <= y <= H:
                 x = PAD_X
                 for text, color in cursor_parts:
-                    if PROMPT_ICON in text:
-                        draw.text((x, y), text, fill=color, font=cjk_font)
-                    else:
-                        draw.text((x, y), text, fill=color, font=font)
+                    blit_text(img, (x, y), text, color)
                     x += len(text) * CHAR_W
-                draw.rectangle([x, y + 8, x + CHAR_W - 8, y + LINE_H - 16],
+                draw.rectangle([x, y + 4, x + CHAR_W - 4, y + LINE_H - 8],
                                fill=CURSOR_COLOR)
         else:
             y = base_y + len(lines) * LINE_H
             if TITLE_BAR_H <= y <= H:
                 x = PAD_X
-                draw.rectangle([x, y + 8, x + CHAR_W - 8, y + LINE_H - 16],
+                draw.rectangle([x, y + 4, x + CHAR_W - 4, y + LINE_H - 8],
                                fill=CURSOR_COLOR)
 
     if extra_draw:
-        extra_draw(draw, base_y, len(lines))
+        extra_draw(img, draw, base_y, len(lines))
 
-    draw.rectangle([0, 0, W, TITLE_BAR_H], fill=TITLE_BG)
+    # draw_title_bar paints the bar background itself
     draw_title_bar(draw)
 
+    _canvas_key = key
+    _canvas_version += 1
     return img
 
 
+# ── Encoder ──
+# Frames stream into ffmpeg's stdin as raw RGB while they are rendered and
+# are dropped right after — only the one being drawn is ever resident.
+# The audio is muxed in afterwards from the recorded frame numbers.
+
+# At -crf 12 the stream is already near-lossless; -preset slow bought a few
+# percent of bitrate for 2-3x the encode time. FAST=1 trades quality for
+# turnaround when iterating on the script.
+if os.environ.get("FAST") == "1":
+    X264_ARGS = ["-crf", "18", "-preset", "ultrafast"]
+else:
+    X264_ARGS = ["-crf", "12", "-preset", "medium"]
+
+
+def video_codec_args():
+    """Prefer the VideoToolbox hardware H.264 encoder when ffmpeg has it."""
+    encoders = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                              capture_output=True, text=True).stdout
+    if "h264_videotoolbox" in encoders:
+        return ["-c:v", "h264_videotoolbox", "-b:v", "40M", "-profile:v", "high"]
+    return ["-c:v", "libx264", *X264_ARGS]
+
+
+work_dir = tempfile.mkdtemp(prefix="kinobi_")
+silent_path = os.path.join(work_dir, "silent.mp4")
+proc = subprocess.Popen([
+    "ffmpeg", "-y",
+    "-f", "rawvideo",
+    "-pix_fmt", "rgb24",
+    "-s", f"{W}x{H}",
+    "-framerate", str(FPS),
+    "-i", "-",
+    "-vf", f"scale={OUT_W}:{OUT_H}:flags=lanczos",
+    *video_codec_args(),
+    "-pix_fmt", "yuv420p",
+    silent_path,
+], stdin=subprocess.PIPE, stderr=subprocess.DEVNULL)
+frame_count = 0
+# The last frame's bytes stay referenced until the next snapshot exists —
+# freeing a 6 MB buffer before allocating the next one lets malloc trim
+# the heap, and every frame then page-faults its buffer back in. An
+# unchanged canvas writes the same bytes again.
+_emitted_version = None  # canvas version last snapshotted, and its bytes
+_emitted_buf = None
+
+
+def emit(img):
+    """Write one frame to the encoder; an unchanged canvas reuses its bytes."""
+    global frame_count, _emitted_version, _emitted_buf
+    if _canvas_version != _emitted_version:
+        _emitted_version, _emitted_buf = _canvas_version, img.tobytes()
+    proc.stdin.write(_emitted_buf)
+    frame_count += 1
+
+
 # ── Frame helpers ──
 PROMPT = [(PROMPT_ICON + " ", PROMPT_COLOR)]
 
-frames = []
 current_lines = []
 
 
@@ -290,44 +470,44 @@ def add_typing(text, color, prompt=True, speed=1, use_prompt=True):
     for i in range(len(text)):
         partial = text[:i+1]
         cursor_parts = prefix + [(partial, color)]
-        tgt = target_scroll(current_lines + [cursor_parts])
+        tgt = target_scroll(len(current_lines) + 1)
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y, cursor_parts=cursor_parts)
         if i % speed == 0:
-            frames.append(f)
+            emit(f)
 
 
 def add_tok():
     """Mark a bamboo tok at the current frame (Enter key)."""
-    tok_frames.append(len(frames))
+    tok_frames.append(frame_count)
 
 
 def add_bell():
     """Mark a temple bell at the current frame (climax completion)."""
-    bell_frames.append(len(frames))
+    bell_frames.append(frame_count)
 
 
 def add_pause(n_frames, blink=True):
     global scroll_y
+    cursor = list(PROMPT)
     for i in range(n_frames):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         vis = (i // BLINK_INTERVAL) % 2 == 0 if blink else True
-        cursor = list(PROMPT)
         f = render_frame(current_lines, scroll_y,
                          cursor_parts=cursor, cursor_visible=vis)
-        frames.append(f)
+        emit(f)
 
 
 def add_pause_no_prompt(n_frames, blink=True):
     global scroll_y
     for i in range(n_frames):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         vis = (i // BLINK_INTERVAL) % 2 == 0 if blink else True
         f = render_frame(current_lines, scroll_y,
                          cursor_parts=[], cursor_visible=vis)
-        frames.append(f)
+        emit(f)
 
 
 def add_output_lines(output, delay=3):
@@ -335,10 +515,22 @@ def add_output_lines(output, delay=3):
     for line in output:
         current_lines.append(line)
         for _ in range(delay):
-            tgt = target_scroll(current_lines)
+            tgt = target_scroll(len(current_lines))
             scroll_y = smooth_scroll(scroll_y, tgt)
             f = render_frame(current_lines, scroll_y)
-            frames.append(f)
+            emit(f)
+
+
+# Progress bar sprite — the rounded bar rasterized once as a hard-edged
+# mask and pasted with a colour fill. A partial fill is the bar's left
+# part plus its right cap moved in.
+BAR_W = 440
+BAR_H = 18
+BAR_RADIUS = 5
+BAR_MASK = Image.new("L", (BAR_W + 1, BAR_H + 1), 0)
+ImageDraw.Draw(BAR_MASK).rounded_rectangle([0, 0, BAR_W, BAR_H],
+                                           radius=BAR_RADIUS, fill=255)
+BAR_CAP = BAR_MASK.crop((BAR_W - 2 * BAR_RADIUS, 0, BAR_W + 1, BAR_H + 1))
 
 
 def add_spinner_progress(status_text, n_frames=36,
@@ -349,42 +541,44 @@ def add_spinner_progress(status_text, n_frames=36,
         cycle_color = CYCLE_COLORS[i % len(CYCLE_COLORS)]
         pct = int(progress * 100)
 
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt + LINE_H * 3)
 
-        def draw_extra(draw, base_y, n_lines, p=progress, cc=cycle_color, st=status_text, pc=pct):
+        def draw_extra(img, draw, base_y, n_lines, p=progress, cc=cycle_color, st=status_text, pc=pct):
             y1 = base_y + n_lines * LINE_H
             if TITLE_BAR_H <= y1 <= H:
                 x = PAD_X + 2 * CHAR_W
-                draw.text((x, y1), PROMPT_ICON + " ", fill=cc, font=cjk_font)
-                draw.text((x + 2 * CHAR_W, y1), st, fill=DIM, font=font)
+                blit_text(img, (x, y1), PROMPT_ICON + " ", cc)
+                blit_text(img, (x + 2 * CHAR_W, y1), st, DIM)
             y2 = base_y + (n_lines + 1) * LINE_H
             if TITLE_BAR_H <= y2 <= H:
                 bar_x = PAD_X + 2 * CHAR_W
-                bar_h = 36
-                bar_w = 880
-                bar_y = y2 + (LINE_H - bar_h) // 2
-                draw.rounded_rectangle([bar_x, bar_y, bar_x + bar_w, bar_y + bar_h],
-                                        radius=10, fill=BAR_BG)
-                fill_w = int(bar_w * p)
-                if fill_w > 10:
-                    draw.rounded_rectangle([bar_x, bar_y, bar_x + fill_w, bar_y + bar_h],
-                                            radius=10, fill=cc)
-                draw.text((bar_x + bar_w + 32, y2), f"{pc}%", fill=DIM, font=small_font)
+                bar_y = y2 + (LINE_H - BAR_H) // 2
+                img.paste(BAR_BG, (bar_x, bar_y), BAR_MASK)
+                fill_w = int(BAR_W * p)
+                if fill_w > 3 * BAR_RADIUS:
+                    body = BAR_MASK.crop((0, 0, fill_w - 2 * BAR_RADIUS, BAR_H + 1))
+                    img.paste(cc, (bar_x, bar_y), body)
+                    img.paste(cc, (bar_x + fill_w - 2 * BAR_RADIUS, bar_y), BAR_CAP)
+                elif fill_w > BAR_RADIUS:
+                    # Too short for body + cap to meet — rasterize it directly
+                    draw.rounded_rectangle([bar_x, bar_y, bar_x + fill_w, bar_y + BAR_H],
+                                            radius=BAR_RADIUS, fill=cc)
+                blit_text(img, (bar_x + BAR_W + 16, y2), f"{pc}%", DIM, small_font)
 
         f = render_frame(current_lines, scroll_y, extra_draw=draw_extra)
-        frames.append(f)
+        emit(f)
 
 
 def add_breathing_pause(n_frames):
     """Only the standalone 木 signoff breathes."""
     global scroll_y
     for i in range(n_frames):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         bc = breath_color(i)
         f = render_frame(current_lines, scroll_y, signoff_color=bc)
-        frames.append(f)
+        emit(f)
 
 
 # ═══════════════════════════════════════════
@@ -525,16 +719,16 @@ wink_line_without = [("# made for machines ... and humans", PRIMARY)]
 for cycle in range(3):
     current_lines[-1] = wink_line_with
     for _ in range(5):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y)
-        frames.append(f)
+        emit(f)
     current_lines[-1] = wink_line_without
     for _ in range(4):
-        tgt = target_scroll(current_lines)
+        tgt = target_scroll(len(current_lines))
         scroll_y = smooth_scroll(scroll_y, tgt)
         f = render_frame(current_lines, scroll_y)
-        frames.append(f)
+        emit(f)
 
 current_lines[-1] = wink_line_with
 add_pause_no_prompt(FPS, blink=False)
@@ -549,27 +743,13 @@ add_breathing_pause(FPS * 4)
 # ──── EXPORT ────
 # ═══════════════════════════════════════════
 
-print(f"Rendering {len(frames)} frames...")
-
-frame_dir = tempfile.mkdtemp(prefix="kinobi_frames_")
-for i, frame in enumerate(frames):
-    frame.save(os.path.join(frame_dir, f"frame_{i:05d}.png"))
+print(f"Encoding {frame_count} frames...")
+proc.stdin.close()
+proc.wait()
 
-wav_path = os.path.join(frame_dir, "audio.wav")
+wav_path = os.path.join(work_dir, "audio.wav")
 print(f"Generating audio ({len(tok_frames)} toks, {len(bell_frames)} bell)...")
-generate_audio(len(frames), wav_path)
-
-silent_path = os.path.join(frame_dir, "silent.mp4")
-subprocess.run([
-    "ffmpeg", "-y",
-    "-framerate", str(FPS),
-    "-i", os.path.join(frame_dir, "frame_%05d.png"),
-    "-c:v", "libx264",
-    "-pix_fmt", "yuv420p",
-    "-crf", "12",
-    "-preset", "slow",
-    silent_path,
-], capture_output=True)
+generate_audio(frame_count, wav_path)
 
 mp4_path = "/Users/ankitpansari/Desktop/kinobi-landing/teaser_v6.mp4"
 subprocess.run([
@@ -584,8 +764,8 @@ subprocess.run([
     mp4_path,
 ], capture_output=True)
 
-shutil.rmtree(frame_dir)
+shutil.rmtree(work_dir)
 
-print(f"Generated {len(frames)} frames at {FPS}fps = {len(frames)/FPS:.1f}s")
+print(f"Generated {frame_count} frames at {FPS}fps = {frame_count/FPS:.1f}s")
 print(f"Audio: {len(tok_frames)} bamboo toks, {len(bell_frames)} temple bell")
-print(f"MP4: {mp4_path} ({os.path.getsize(mp4_path) / 1024:.0f}KB) — {W}x{H}")
+print(f"MP4: {mp4_path} ({os.path.getsize(mp4_path) / 1024:.0f}KB) — {OUT_W}x{OUT_H} (rendered at {W}x{H})")